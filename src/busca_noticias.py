@@ -5,18 +5,44 @@ realizando diversas validações e tratamento do conteúdo para remover
 tags HTML que possam comprometer a consistência do JSON.
 """
 
+from collections import defaultdict
 from datetime import datetime
-import json
+import asyncio
+import binascii
+import hashlib
+import html
 import os
-import uuid
+import sys
+import aiohttp
 import feedparser
+import orjson
 from bs4 import BeautifulSoup
+from bs4.builder import LXMLTreeBuilder
+from lxml import html as lxml_html
+from lxml import etree
+from lxml.etree import ParserError
 from tqdm import tqdm
 from colorama import init, Fore
 
 # Inicializa o colorama
 init()
 
+# Builder do BeautifulSoup criado uma única vez e reaproveitado em todas as chamadas,
+# evitando a busca no registro de builders a cada texto
+CONSTRUTOR_LXML = LXMLTreeBuilder()
+
+# Parser do lxml para resumos reenviados como bytes UTF-8
+PARSER_HTML_UTF8 = lxml_html.HTMLParser(encoding='utf-8')
+
+# Quantidade de feeds baixados simultaneamente
+MAX_DOWNLOADS_SIMULTANEOS = 16
+
+# Índice com as chaves das notícias já salvas, usado na detecção de duplicatas
+ARQUIVO_INDICE_DEDUP = ".dedup_index.json"
+
+# ETag e Last-Modified de cada feed, usados para GET condicional
+ARQUIVO_CACHE_FEEDS = ".feed_cache.json"
+
 
 def limpar_texto(texto: str) -> str:
     """
@@ -33,7 +59,7 @@ def limpar_texto(texto: str) -> str:
     if not texto.lstrip().startswith("<"):
         # Se o texto não iniciar com '<', podemos supor que não é markup
         return texto
-    return BeautifulSoup(texto, "html.parser").get_text(separator=" ", strip=True)
+    return BeautifulSoup(texto, builder=CONSTRUTOR_LXML).get_text(separator=" ", strip=True)
 
 
 def processar_conteudo(texto: str) -> tuple:
@@ -47,13 +73,65 @@ def processar_conteudo(texto: str) -> tuple:
     Returns:
         tuple: (imagem, conteudo_limpo)
     """
-    soup = BeautifulSoup(texto, 'html.parser')
-    img_tag = soup.find('img')
-    imagem = img_tag['src'] if img_tag and 'src' in img_tag.attrs else ''
-    conteudo_limpo = soup.get_text(separator=' ', strip=True)
+    if '<' not in texto:
+        # Sem nenhuma tag, não há imagem a extrair nem markup a remover; o texto
+        # é um único trecho, tratado como no caminho com markup (entidades
+        # decodificadas e espaços das pontas removidos)
+        return '', html.unescape(texto).strip()
+    try:
+        try:
+            arvore = lxml_html.fromstring(texto)
+        except ValueError:
+            # str com declaração de encoding (<?xml ... encoding="..."?>) não é
+            # aceita pelo lxml; em bytes, com o encoding fixado, a declaração é ignorada
+            arvore = lxml_html.fromstring(texto.encode('utf-8'), parser=PARSER_HTML_UTF8)
+    except (ParserError, ValueError):
+        # Documento sem nenhum elemento (ex.: apenas comentários) ou ilegível;
+        # descarta só este resumo, não o feed inteiro
+        return '', ''
+    # iter() inclui a própria raiz, caso o resumo seja apenas um <img>
+    img_tag = next(arvore.iter('img'), None)
+    imagem = img_tag.get('src', '') if img_tag is not None else ''
+    # Assim como o get_text do BeautifulSoup, ignora o código de scripts e estilos
+    etree.strip_elements(arvore, 'script', 'style', with_tail=False)
+    conteudo_limpo = ' '.join(trecho.strip() for trecho in arvore.itertext() if trecho.strip())
     return imagem, conteudo_limpo
 
 
+def gerar_uuid4() -> str:
+    """
+    Gera um UUID versão 4 já formatado como string.
+
+    Equivale a str(uuid.uuid4()), mas monta o texto direto dos bytes
+    aleatórios, sem criar o objeto UUID intermediário.
+
+    Returns:
+        UUID no formato xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx
+    """
+    dados = bytearray(os.urandom(16))
+    dados[6] = (dados[6] & 0x0f) | 0x40  # versão 4
+    dados[8] = (dados[8] & 0x3f) | 0x80  # variante RFC 4122
+    h = binascii.hexlify(dados).decode()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def gravar_arquivo(caminho: str, conteudo: bytes) -> None:
+    """
+    Grava o conteúdo em um arquivo temporário e o move para o destino.
+
+    Como os.replace é atômico, uma interrupção no meio da escrita nunca
+    deixa o arquivo de destino truncado ou com JSON pela metade.
+
+    Args:
+        caminho: Caminho final do arquivo
+        conteudo: Bytes a serem gravados
+    """
+    temporario = caminho + ".tmp"
+    with open(temporario, 'wb') as arquivo:
+        arquivo.write(conteudo)
+    os.replace(temporario, caminho)
+
+
 def carregar_feeds(caminho_arquivo: str) -> list:
     """
     Carrega a lista de feeds do arquivo JSON.
@@ -67,8 +145,8 @@ def carregar_feeds(caminho_arquivo: str) -> list:
     Raises:
         ValueError: Se o arquivo estiver inválido
     """
-    with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
-        feeds = json.load(arquivo)
+    with open(caminho_arquivo, 'rb') as arquivo:
+        feeds = orjson.loads(arquivo.read())
 
     if not isinstance(feeds, list) or not feeds:
         raise ValueError("Arquivo de feeds inválido ou vazio")
@@ -76,15 +154,108 @@ def carregar_feeds(caminho_arquivo: str) -> list:
     return feeds
 
 
-def coletar_noticias(feed: dict) -> list:
+def carregar_cache_feeds(diretorio_saida: str) -> dict:
+    """
+    Carrega o ETag e o Last-Modified recebidos na última coleta de cada feed.
+
+    Args:
+        diretorio_saida: Diretório onde os JSONs de notícias são salvos
+
+    Returns:
+        Dicionário de url para {"etag": ..., "modified": ...}
+    """
+    caminho_cache = os.path.join(diretorio_saida, ARQUIVO_CACHE_FEEDS)
+    if not os.path.exists(caminho_cache):
+        return {}
+    try:
+        with open(caminho_cache, 'rb') as arquivo:
+            cache = orjson.loads(arquivo.read())
+    except Exception as erro:
+        print(f"[ERRO] Falha ao ler o cache de feeds {caminho_cache}: {erro}")
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def salvar_cache_feeds(cache: dict, diretorio_saida: str) -> None:
+    """
+    Salva o ETag e o Last-Modified de cada feed para a próxima coleta.
+
+    Args:
+        cache: Dicionário de url para {"etag": ..., "modified": ...}
+        diretorio_saida: Diretório onde os JSONs de notícias são salvos
+    """
+    os.makedirs(diretorio_saida, exist_ok=True)
+    caminho_cache = os.path.join(diretorio_saida, ARQUIVO_CACHE_FEEDS)
+    try:
+        gravar_arquivo(caminho_cache, orjson.dumps(
+            cache, option=orjson.OPT_INDENT_2))
+    except Exception as erro:
+        print(f"[ERRO] Problema ao salvar o cache de feeds {caminho_cache}: {erro}")
+
+
+async def baixar_feed(sessao: aiohttp.ClientSession, url: str, anterior: dict) -> tuple:
+    """
+    Baixa o conteúdo bruto de um feed, com GET condicional quando possível.
+
+    Args:
+        sessao: Sessão HTTP compartilhada entre os downloads
+        url: Endereço do feed
+        anterior: {"etag": ..., "modified": ...} recebidos na última coleta
+
+    Returns:
+        tuple: (status HTTP, conteúdo em bytes, cabeçalhos da resposta)
+    """
+    cabecalhos = {}
+    if anterior.get('etag'):
+        cabecalhos['If-None-Match'] = anterior['etag']
+    if anterior.get('modified'):
+        cabecalhos['If-Modified-Since'] = anterior['modified']
+
+    async with sessao.get(url, headers=cabecalhos) as resposta:
+        if resposta.status == 304:
+            return resposta.status, b'', {}
+        resposta.raise_for_status()
+        conteudo = await resposta.read()
+        # O feedparser espera os cabeçalhos em minúsculas; content-location
+        # serve de base para resolver links relativos
+        cabecalhos_resposta = {chave.lower(): valor
+                               for chave, valor in resposta.headers.items()}
+        cabecalhos_resposta['content-location'] = str(resposta.url)
+        return resposta.status, conteudo, cabecalhos_resposta
+
+
+def processar_feed(conteudo: bytes, fonte: str, cabecalhos: dict) -> list:
+    """
+    Interpreta o conteúdo bruto de um feed e cria as notícias.
+
+    Args:
+        conteudo: Conteúdo do feed em bytes
+        fonte: Nome da fonte da notícia
+        cabecalhos: Cabeçalhos da resposta HTTP, em minúsculas
+
+    Returns:
+        Lista de notícias do feed
+    """
+    feed_dados = feedparser.parse(conteudo, response_headers=cabecalhos)
+    return [criar_noticia(item, fonte) for item in feed_dados.entries]
+
+
+async def coletar_noticias(sessao: aiohttp.ClientSession, semaforo: asyncio.Semaphore,
+                           feed: dict, cache: dict = None) -> list:
     """
     Coleta notícias de um feed RSS.
 
+    Quando um cache é informado, a requisição é condicional (ETag/Last-Modified)
+    e o cache é atualizado com os valores devolvidos pelo servidor.
+
     Args:
+        sessao: Sessão HTTP compartilhada entre os downloads
+        semaforo: Limita quantos downloads acontecem ao mesmo tempo
         feed: Dicionário com dados do feed (fonte e url)
+        cache: Dicionário de url para {"etag": ..., "modified": ...}
 
     Returns:
-        Lista de notícias coletadas
+        Lista de notícias coletadas, ou None se o feed não mudou desde a última coleta
     """
     noticias = []
     fonte = feed.get('fonte', 'Desconhecida')
@@ -95,11 +266,19 @@ def coletar_noticias(feed: dict) -> list:
         return noticias
 
     try:
-        feed_dados = feedparser.parse(url)
+        anterior = cache.get(url, {}) if cache is not None else {}
+        async with semaforo:
+            status, conteudo, cabecalhos = await baixar_feed(sessao, url, anterior)
+
+        # 304: o servidor confirmou que nada mudou, não há o que processar
+        if status == 304:
+            return None
 
-        for item in feed_dados.entries:
-            noticia = criar_noticia(item, fonte)
-            noticias.append(noticia)
+        noticias = processar_feed(conteudo, fonte, cabecalhos)
+
+        if cache is not None and (cabecalhos.get('etag') or cabecalhos.get('last-modified')):
+            cache[url] = {'etag': cabecalhos.get('etag'),
+                          'modified': cabecalhos.get('last-modified')}
 
     except Exception as erro:
         print(f"Erro ao processar feed {fonte}: {erro}")
@@ -107,6 +286,29 @@ def coletar_noticias(feed: dict) -> list:
     return noticias
 
 
+async def coletar_feeds(feeds: list, cache: dict = None) -> list:
+    """
+    Coleta todos os feeds de forma concorrente.
+
+    Args:
+        feeds: Lista de feeds (fonte e url)
+        cache: Dicionário de url para {"etag": ..., "modified": ...}
+
+    Returns:
+        Resultado de coletar_noticias para cada feed, na mesma ordem de feeds
+    """
+    semaforo = asyncio.Semaphore(MAX_DOWNLOADS_SIMULTANEOS)
+
+    async with aiohttp.ClientSession(headers={'User-Agent': feedparser.USER_AGENT}) as sessao:
+        with tqdm(total=len(feeds), desc="Coletando feeds", unit="feed", colour='green', bar_format="{l_bar}{bar:30}{r_bar}{bar:-30b}") as barra:
+            async def coletar_e_avancar(feed_info: dict) -> list:
+                resultado = await coletar_noticias(sessao, semaforo, feed_info, cache)
+                barra.update()
+                return resultado
+
+            return await asyncio.gather(*(coletar_e_avancar(feed_info) for feed_info in feeds))
+
+
 def criar_noticia(item: dict, fonte: str) -> dict:
     """
     Cria objeto de notícia a partir de item do feed.
@@ -122,15 +324,18 @@ def criar_noticia(item: dict, fonte: str) -> dict:
     # Extrai a imagem e limpa o conteúdo do HTML
     imagem, conteudo = processar_conteudo(
         item.get('summary', item.get('description', '')))
+    titulo = limpar_texto(item.get('title', 'Sem título'))
 
     return {
-        "id": str(uuid.uuid4()),
-        "titulo": limpar_texto(item.get('title', 'Sem título')),
+        "id": gerar_uuid4(),
+        "titulo": titulo,
         "conteudo": conteudo,
         "imagem": imagem,
         "fonte": fonte,
         "data": data,
-        "url": item.get('link', '')
+        "url": item.get('link', ''),
+        # Título já normalizado para a detecção de duplicatas; não vai para o disco
+        "_dedup_key": titulo.strip().lower()
     }
 
 
@@ -144,10 +349,10 @@ def obter_data_publicacao(item: dict) -> str:
     Returns:
         Data formatada como string YYYY-MM-DD
     """
-    if item.get('published_parsed'):
-        return datetime(*item.published_parsed[:6]).strftime('%Y-%m-%d')
-    elif item.get('updated_parsed'):
-        return datetime(*item.updated_parsed[:6]).strftime('%Y-%m-%d')
+    # Formata direto do struct_time, sem construir um datetime por item
+    data = item.get('published_parsed') or item.get('updated_parsed')
+    if data:
+        return f"{data[0]:04d}-{data[1]:02d}-{data[2]:02d}"
     return datetime.now().strftime('%Y-%m-%d')
 
 
@@ -161,77 +366,164 @@ def agrupar_noticias_por_data(noticias: list) -> dict:
     Retorna:
         dict: Dicionário onde a chave é a data (YYYY-MM-DD) e o valor é uma lista de notícias.
     """
-    agrupadas = {}
+    agrupadas = defaultdict(list)
     for noticia in noticias:
-        data = noticia.get("data")
-        if data not in agrupadas:
-            agrupadas[data] = []
-        agrupadas[data].append(noticia)
-    return agrupadas
+        agrupadas[noticia.get("data")].append(noticia)
+    return dict(agrupadas)
+
+
+def chave_dedup(noticia: dict) -> tuple:
+    """
+    Gera a chave usada na detecção de duplicatas dentro de uma mesma data.
+    Usa o título normalizado em criar_noticia (_dedup_key) quando disponível.
+
+    Parâmetros:
+        noticia (dict): Notícia a ser identificada.
+
+    Retorna:
+        tuple: (hash curto do título normalizado, fonte)
+    """
+    titulo = noticia.get('_dedup_key')
+    if titulo is None:
+        titulo = noticia.get('titulo', '').strip().lower()
+    resumo = hashlib.sha1(titulo.encode('utf-8')).hexdigest()[:16]
+    # A fonte se repete em quase todas as chaves; internada, compara por identidade
+    return resumo, sys.intern(noticia.get('fonte', '').strip())
+
+
+def carregar_indice_dedup(diretorio_saida: str) -> dict:
+    """
+    Carrega o índice de chaves de duplicatas já gravadas em disco.
+
+    Parâmetros:
+        diretorio_saida (str): Diretório onde os JSONs de notícias são salvos.
+
+    Retorna:
+        dict: Dicionário onde a chave é a data e o valor é um conjunto de chaves.
+    """
+    caminho_indice = os.path.join(diretorio_saida, ARQUIVO_INDICE_DEDUP)
+    if not os.path.exists(caminho_indice):
+        return {}
+    try:
+        with open(caminho_indice, 'rb') as arquivo:
+            indice = orjson.loads(arquivo.read())
+        return {data: {(resumo, sys.intern(fonte)) for resumo, fonte in chaves}
+                for data, chaves in indice.items()}
+    except Exception as erro:
+        print(
+            f"[ERRO] Falha ao ler o índice de duplicatas {caminho_indice}: {erro}")
+        return {}
+
+
+def salvar_indice_dedup(indice: dict, diretorio_saida: str) -> None:
+    """
+    Salva o índice de chaves de duplicatas em disco.
+
+    Parâmetros:
+        indice (dict): Dicionário de data para conjunto de chaves.
+        diretorio_saida (str): Diretório onde os JSONs de notícias são salvos.
+    """
+    caminho_indice = os.path.join(diretorio_saida, ARQUIVO_INDICE_DEDUP)
+    serializavel = {data: sorted(chaves) for data, chaves in indice.items()}
+    try:
+        gravar_arquivo(caminho_indice, orjson.dumps(serializavel))
+    except Exception as erro:
+        print(
+            f"[ERRO] Problema ao salvar o índice de duplicatas {caminho_indice}: {erro}")
 
 
-def salvar_noticias(agrupadas: dict, diretorio_saida: str) -> None:
+def carregar_noticias_existentes(nome_arquivo: str) -> list:
+    """
+    Carrega as notícias já salvas para uma data.
+
+    Parâmetros:
+        nome_arquivo (str): Caminho do arquivo JSON da data.
+
+    Retorna:
+        list: Notícias existentes, ou lista vazia se o arquivo não existir ou for inválido.
+    """
+    if not os.path.exists(nome_arquivo):
+        return []
+    try:
+        with open(nome_arquivo, 'rb') as arquivo:
+            noticias_existentes = orjson.loads(arquivo.read())
+    except Exception as erro:
+        print(
+            f"[ERRO] Falha ao ler o arquivo existente {nome_arquivo}: {erro}")
+        return []
+    # Verifica se as notícias existentes são uma lista
+    if not isinstance(noticias_existentes, list):
+        print(
+            f"[ERRO] Conteúdo inválido no arquivo {nome_arquivo}. Substituindo pelo novo conteúdo.")
+        return []
+    return noticias_existentes
+
+
+def salvar_noticias(agrupadas: dict, diretorio_saida: str) -> bool:
     """
     Salva as notícias agrupadas por data em arquivos JSON separados.
     Se o arquivo para determinada data já existir, realiza um append dos novos
     itens à lista existente, garantindo que não haja duplicatas (mesmo título, fonte e data).
 
+    As chaves das notícias já gravadas ficam no índice ARQUIVO_INDICE_DEDUP, de
+    modo que o JSON de uma data só é relido quando há notícias novas para ela.
+
     Parâmetros:
         agrupadas (dict): Dicionário com notícias agrupadas por data.
         diretorio_saida (str): Caminho do diretório onde os arquivos serão salvos.
+
+    Retorna:
+        bool: True se todas as datas com notícias novas foram gravadas.
     """
     os.makedirs(diretorio_saida, exist_ok=True)
+    indice = carregar_indice_dedup(diretorio_saida)
+    sucesso = True
 
     for data, noticias in tqdm(agrupadas.items(), desc="Salvando notícias", unit="data", colour='green', bar_format="{l_bar}{bar:30}{r_bar}{bar:-30b}"):
         nome_arquivo = os.path.join(diretorio_saida, f"{data}.json")
-        # Se o arquivo existir, carrega o conteúdo existente e realiza o append
-        if os.path.exists(nome_arquivo):
-            try:
-                with open(nome_arquivo, 'r', encoding='utf-8') as arquivo:
-                    noticias_existentes = json.load(arquivo)
-                # Verifica se as notícias existentes são uma lista
-                if not isinstance(noticias_existentes, list):
-                    print(
-                        f"[ERRO] Conteúdo inválido no arquivo {nome_arquivo}. Substituindo pelo novo conteúdo.")
-                    noticias_existentes = []
-            except Exception as erro:
-                print(
-                    f"[ERRO] Falha ao ler o arquivo existente {nome_arquivo}: {erro}")
-                noticias_existentes = []
-        else:
-            noticias_existentes = []
+        noticias_existentes = None
 
-        # Cria um conjunto de chaves únicas das notícias existentes
-        existentes_keys = set()
-        for n in noticias_existentes:
-            titulo = n.get('titulo', '').strip().lower()
-            fonte = n.get('fonte', '').strip()
-            data_noticia = n.get('data', '')
-            existentes_keys.add((titulo, fonte, data_noticia))
+        # Sem entrada no índice (ou sem arquivo), reconstrói as chaves a partir do disco
+        existentes_keys = indice.get(data)
+        if existentes_keys is None or not os.path.exists(nome_arquivo):
+            noticias_existentes = carregar_noticias_existentes(nome_arquivo)
+            existentes_keys = {chave_dedup(n) for n in noticias_existentes}
+            indice[data] = existentes_keys
 
         # Processar as novas notícias para remover duplicatas
         novas_sem_duplicatas = []
         novas_keys = set()
         for noticia in noticias:
-            titulo = noticia.get('titulo', '').strip().lower()
-            fonte = noticia.get('fonte', '').strip()
-            data_noticia = noticia.get('data', '')
-            key = (titulo, fonte, data_noticia)
+            key = chave_dedup(noticia)
+            noticia.pop('_dedup_key', None)
 
             if key not in existentes_keys and key not in novas_keys:
                 novas_sem_duplicatas.append(noticia)
                 novas_keys.add(key)
 
+        # Nada de novo para esta data, o arquivo permanece como está
+        if not novas_sem_duplicatas:
+            continue
+
+        if noticias_existentes is None:
+            noticias_existentes = carregar_noticias_existentes(nome_arquivo)
+
         # Combina as notícias existentes com as novas sem duplicatas
         noticias_combinadas = noticias_existentes + novas_sem_duplicatas
 
         try:
-            with open(nome_arquivo, 'w', encoding='utf-8') as arquivo:
-                json.dump(noticias_combinadas, arquivo,
-                          ensure_ascii=False, indent=4)
+            gravar_arquivo(nome_arquivo, orjson.dumps(
+                noticias_combinadas, option=orjson.OPT_INDENT_2))
         except Exception as erro_salvar:
             print(
                 f"[ERRO] Problema ao salvar notícias para a data {data}: {erro_salvar}")
+            sucesso = False
+            continue
+        # Só registra as chaves no índice após a gravação bem-sucedida
+        existentes_keys.update(novas_keys)
+
+    salvar_indice_dedup(indice, diretorio_saida)
+    return sucesso
 
 
 def etapa_coleta(caminho_feeds: str, diretorio_saida: str) -> None:
@@ -248,21 +540,38 @@ def etapa_coleta(caminho_feeds: str, diretorio_saida: str) -> None:
         print(f"[ERRO] {erro}")
         return
 
+    cache_feeds = carregar_cache_feeds(diretorio_saida)
+
+    # A coleta é limitada pela rede, então os downloads são feitos de forma concorrente
+    resultados = asyncio.run(coletar_feeds(feeds, cache_feeds))
+
     todas_noticias = []
-    for feed_info in feeds:
-        noticias_feed = coletar_noticias(feed_info)
-        if noticias_feed:
+    sem_alteracoes = 0
+    for feed_info, noticias_feed in zip(feeds, resultados):
+        if noticias_feed is None:
+            sem_alteracoes += 1
+            print(
+                f"[INFO] Feed sem alterações desde a última coleta: {feed_info.get('fonte', 'Fonte desconhecida')}")
+        elif noticias_feed:
             todas_noticias.extend(noticias_feed)
         else:
             print(
                 f"[AVISO] Nenhuma notícia coletada para o feed: {feed_info.get('fonte', 'Fonte desconhecida')}")
 
     if not todas_noticias:
-        print("[ERRO] Nenhuma notícia foi coletada de nenhum feed.")
+        if sem_alteracoes == len(feeds):
+            print("[INFO] Nenhum feed mudou desde a última coleta.")
+        else:
+            print("[ERRO] Nenhuma notícia foi coletada de nenhum feed.")
         return
 
     noticias_agrupadas = agrupar_noticias_por_data(todas_noticias)
-    salvar_noticias(noticias_agrupadas, diretorio_saida)
+    # Só grava o cache depois que as notícias estão em disco; se alguma data
+    # falhou, os feeds precisam ser baixados de novo na próxima coleta
+    if salvar_noticias(noticias_agrupadas, diretorio_saida):
+        salvar_cache_feeds(cache_feeds, diretorio_saida)
+    else:
+        print("[AVISO] Cache de feeds não atualizado por falha ao salvar notícias.")
 
 
 def main():
@@ -1,29 +1,31 @@
 #!/usr/bin/env python3
-from typing import List
-import subprocess
 import os
+from busca_noticias import etapa_coleta
+from valida_json import percorrer_jsons
 
 def executar_scripts() -> None:
     """
-    Executa os scripts do projeto na ordem correta.
-    Em caso de erro em algum script, interrompe a execução.
+    Executa as etapas do projeto na ordem correta, no mesmo processo.
+    Em caso de erro em alguma etapa, interrompe a execução.
     """
     diretorio_base = os.path.dirname(os.path.abspath(__file__))
     diretorio_news = os.path.join(diretorio_base, "..", "data", "news")
     diretorio_news_compiladas = os.path.join(diretorio_base, "..", "data", "news_compiladas")
-    
+    caminho_feeds = os.path.join(diretorio_base, "..", "rss_feeds.json")
 
-    scripts = [
-        ["python", "src/busca_noticias.py"],
-        ["python", "src/valida_json.py", diretorio_news]
+    etapas = [
+        ("coleta de notícias", lambda: etapa_coleta(caminho_feeds, diretorio_news)),
+        ("validação dos JSON", lambda: percorrer_jsons(diretorio_news))
     ]
-    
-    for comando in scripts:
-        resultado = subprocess.run(comando)
-        
-        if resultado.returncode != 0:
-            print(f"Erro ao executar {comando[1]}. Processo interrompido.")
+
+    for nome, etapa in etapas:
+        print(f"\n====== Iniciando etapa: {nome} ======")
+        try:
+            etapa()
+        except Exception as erro:
+            print(f"Erro ao executar {nome}: {erro}. Processo interrompido.")
             break
+        print(f"====== Etapa concluída: {nome} ======")
 
 if __name__ == '__main__':
     executar_scripts()
@@ -7,11 +7,12 @@ data/logs/jsons_bugs.log.
 """
 
 import os
-import json
 import re
+from concurrent.futures import ProcessPoolExecutor
 import uuid
 from datetime import datetime
 import sys
+import orjson
 from tqdm import tqdm
 from colorama import init, Fore, Style
 
@@ -24,6 +25,9 @@ DIR_NEWS = os.path.join("data", "news")
 DIR_LOGS = os.path.join("data", "logs")
 LOG_FILE = os.path.join(DIR_LOGS, "jsons_bugs.log")
 
+# Vírgula sobrando antes do fechamento de objeto ou lista
+REGEX_VIRGULA_FINAL = re.compile(r",\s*([}\]])")
+
 def registrar_erro(mensagem: str) -> None:
     """
     Registra mensagem de erro exibindo-o em vermelho.
@@ -43,9 +47,9 @@ def corrigir_json(conteudo: str) -> str:
     Returns:
         JSON corrigido.
     """
-    return re.sub(r",\s*([}\]])", r"\1", conteudo)
+    return REGEX_VIRGULA_FINAL.sub(r"\1", conteudo)
 
-def validar_dados(dados: list, arquivo: str) -> list:
+def validar_dados(dados: list, arquivo: str) -> tuple:
     """
     Valida e corrige a estrutura dos dados.
     
@@ -54,22 +58,25 @@ def validar_dados(dados: list, arquivo: str) -> list:
         arquivo: Nome do arquivo sendo processado.
         
     Returns:
-        Lista de dados validados e corrigidos.
+        tuple: (lista de dados validados e corrigidos, se houve alguma correção)
     """
     if not isinstance(dados, list):
         raise ValueError("Dados devem ser uma lista")
 
+    modificado = False
     dados_validados = []
     for i, item in enumerate(dados):
         if not isinstance(item, dict):
             registrar_erro(f"Item {i} inválido em {arquivo}")
+            modificado = True
             continue
 
-        item_validado = validar_item(item, i, arquivo)
+        item_validado, item_modificado = validar_item(item, i, arquivo)
+        modificado = modificado or item_modificado
         dados_validados.append(item_validado)
-    return dados_validados
+    return dados_validados, modificado
 
-def validar_item(item: dict, posicao: int, arquivo: str) -> dict:
+def validar_item(item: dict, posicao: int, arquivo: str) -> tuple:
     """
     Valida e corrige um item individual.
     
@@ -79,16 +86,18 @@ def validar_item(item: dict, posicao: int, arquivo: str) -> dict:
         arquivo: Nome do arquivo.
         
     Returns:
-        Item validado e corrigido.
+        tuple: (item validado e corrigido, se alguma chave foi adicionada)
     """
+    modificado = False
     for chave in CHAVES_OBRIGATORIAS:
         if chave not in item:
             if chave == "id":
                 item[chave] = str(uuid.uuid4())
             else:
                 item[chave] = ""
+            modificado = True
             registrar_erro(f"Chave '{chave}' ausente no item {posicao} de {arquivo}")
-    return item
+    return item, modificado
 
 def processar_arquivo(caminho: str) -> None:
     """
@@ -97,19 +106,28 @@ def processar_arquivo(caminho: str) -> None:
     Args:
         caminho: Caminho do arquivo a ser processado.
     """
-    with open(caminho, "r", encoding="utf-8") as arquivo:
+    with open(caminho, "rb") as arquivo:
         conteudo = arquivo.read()
 
+    corrigido = False
     try:
-        dados = json.loads(conteudo)
-    except json.JSONDecodeError:
-        conteudo = corrigir_json(conteudo)
-        dados = json.loads(conteudo)
+        # orjson lê os bytes direto, sem decodificar para str antes
+        dados = orjson.loads(conteudo)
+    except orjson.JSONDecodeError:
+        dados = orjson.loads(corrigir_json(conteudo.decode("utf-8")))
+        corrigido = True
+
+    dados_validados, modificado = validar_dados(dados, caminho)
 
-    dados_validados = validar_dados(dados, caminho)
+    # Arquivo já válido, não há o que regravar
+    if not corrigido and not modificado:
+        return
 
-    with open(caminho, "w", encoding="utf-8") as arquivo:
-        json.dump(dados_validados, arquivo, indent=2, ensure_ascii=False)
+    # Grava em um temporário e substitui, para nunca deixar o arquivo pela metade
+    temporario = caminho + ".tmp"
+    with open(temporario, "wb") as arquivo:
+        arquivo.write(orjson.dumps(dados_validados, option=orjson.OPT_INDENT_2))
+    os.replace(temporario, caminho)
 
 def percorrer_jsons(diretorio: str) -> None:
     """
@@ -122,16 +140,22 @@ def percorrer_jsons(diretorio: str) -> None:
         print(f"{Fore.RED}Diretório '{diretorio}' não encontrado.{Style.RESET_ALL}")
         return
 
-    arquivos = [
-        os.path.join(diretorio, f)
-        for f in os.listdir(diretorio)
-        if f.lower().endswith('.json')
-    ]
-
-    with tqdm(arquivos, desc="Validando JSON", unit="arquivo", 
-              colour='green', bar_format="{l_bar}{bar:30}{r_bar}{bar:-30b}") as barra:
-        for arquivo in barra:
-            processar_arquivo(arquivo)
+    with os.scandir(diretorio) as entradas:
+        arquivos = [
+            entrada.path
+            for entrada in entradas
+            if entrada.is_file()
+            and entrada.name.lower().endswith('.json')
+            and not entrada.name.startswith('.')
+        ]
+
+    # A validação é limitada pela CPU, então cada arquivo vai para um processo
+    with ProcessPoolExecutor() as executor:
+        resultados = executor.map(processar_arquivo, arquivos, chunksize=8)
+        with tqdm(resultados, total=len(arquivos), desc="Validando JSON", unit="arquivo", 
+                  colour='green', bar_format="{l_bar}{bar:30}{r_bar}{bar:-30b}") as barra:
+            for _ in barra:
+                pass
 
 def main():
     """